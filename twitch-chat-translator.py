@@ -29,22 +29,104 @@ Run locally:
 
 import html
 import json
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import threading
 import time
-import uuid
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import requests
+import httpx
+import orjson
 import websocket
 from dotenv import load_dotenv
-from langdetect import detect
+from langdetect import PROFILES_DIRECTORY
+from langdetect.detector_factory import DetectorFactory
+from langdetect.utils.lang_profile import LangProfile
 import unicodedata
 
+try:
+    import pycld2
+except ImportError:  # optional – we fall back to langdetect below
+    pycld2 = None
+
 load_dotenv()
 
+# ─── LOGGING ─────────────────────────────────────────────────────────────
+# Every message used to trigger several print() calls, each flushing stdout
+# under a lock on the hot threads. Records go through a queue instead; a
+# background listener does the actual I/O. Skip chatter is logged at DEBUG so
+# production runs can mute it via LOG_LEVEL.
+log = logging.getLogger("twitch-chat-translator")
+
+def _setup_logging():
+    log_queue = queue.Queue(-1)
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+# Only these profiles can ever matter: the allowed source languages (zh ships as
+# zh-cn/zh-tw) plus the target. Loading 6 profiles instead of all 55 shrinks the
+# probability tables ~10x and makes every detect() scoring pass cheaper.
+_DETECTOR_PROFILES = {"tr", "ko", "ru", "zh-cn", "zh-tw", "en"}
+
+def _load_profiles(factory: DetectorFactory, langs: set) -> None:
+    filenames = sorted(f for f in os.listdir(PROFILES_DIRECTORY) if f in langs)
+    for index, filename in enumerate(filenames):
+        with open(os.path.join(PROFILES_DIRECTORY, filename), "r", encoding="utf-8") as f:
+            profile = LangProfile(**json.load(f))
+        factory.add_profile(profile, index, len(filenames))
+
+# Shared langdetect factory – loading the n-gram profiles once at import avoids
+# re-initializing detector state on every incoming chat message.
+_detector_factory = DetectorFactory()
+_load_profiles(_detector_factory, _DETECTOR_PROFILES)
+_detector_factory.seed = 0
+
+# CLD2 uses BCP-47 script tags for Chinese; normalize to langdetect-style codes
+# so the rest of the pipeline keeps its zh-cn/zh-tw convention.
+_CLD2_LANG_MAP = {"zh": "zh-cn", "zh-Hans": "zh-cn", "zh-Hant": "zh-tw"}
+
+# Any Unicode letter ([^\W\d_] = word char that isn't a digit or underscore).
+# A compiled search stops at the first letter and runs in C, unlike a
+# per-character isalpha() pass through the interpreter.
+_ALPHA_RE = re.compile(r'[^\W\d_]')
+
+def _preprocess(msg: str) -> Optional[str]:
+    """Strip a message and return it if it is worth detecting, else None."""
+    clean = msg.strip()
+    if len(clean) < MIN_MESSAGE_LENGTH:
+        return None
+    if _ALPHA_RE.search(clean) is None:
+        return None
+    if len(clean) < _DETECT_MIN_LEN and clean.isascii():
+        return None
+    return clean
+
+def _detect(text: str) -> str:
+    # CLD2 is roughly an order of magnitude faster than langdetect; use it when
+    # available and only fall back to langdetect for unreliable/unknown results.
+    if pycld2 is not None:
+        try:
+            is_reliable, _, details = pycld2.detect(text)
+            code = details[0][1]
+            if is_reliable and code != "un":
+                return _CLD2_LANG_MAP.get(code, code)
+        except pycld2.error:
+            pass
+    detector = _detector_factory.create()
+    detector.append(text)
+    return detector.detect()
+
 # ─── CONFIG ──────────────────────────────────────────────────────────────
 IRC_URL = "wss://irc-ws.chat.twitch.tv:443"
 
@@ -61,8 +143,24 @@ TARGET_LANGUAGE = os.getenv("TARGET_LANGUAGE", "en")
 MIN_MESSAGE_LENGTH = int(os.getenv("MIN_MESSAGE_LENGTH", "2"))
 RATE_LIMIT_DELAY = int(os.getenv("RATE_LIMIT_DELAY", "0"))
 
-# Only translate these languages in Twitch chat
-ALLOWED_LANGUAGES = {"tr", "ko", "ru", "zh"}
+# Threads handling PRIVMSGs concurrently; translations overlap their Azure
+# round-trips across these workers
+WORKER_THREADS = int(os.getenv("WORKER_THREADS", "4"))
+
+# Detectors are slow and unreliable on short strings – skip detection below
+# this length unless the text contains non-ASCII codepoints (short CJK/Cyrillic
+# messages can still be meaningful)
+_DETECT_MIN_LEN = int(os.getenv("DETECT_MIN_LEN", "12"))
+
+# Batch window for Azure requests: pending messages are flushed every
+# _BATCH_WINDOW seconds, or immediately once _BATCH_MAX are queued
+# (Azure's /translate accepts up to 100 strings per call).
+_BATCH_WINDOW = 0.15
+_BATCH_MAX = 25
+
+# Only translate these languages in Twitch chat (base codes – regional variants
+# like zh-cn/zh-tw match on their base language)
+ALLOWED_LANGUAGES = frozenset({"tr", "ko", "ru", "zh"})
 
 # Add set of common English phrases
 COMMON_ENGLISH_PHRASES = {
@@ -72,6 +170,22 @@ COMMON_ENGLISH_PHRASES = {
     'yo', 'sup','hii', 'hiii','bye', 'yes', 'yeah', 'no', 'nah', 'nope',
 }
 
+# Exact-match noise tokens and bare URLs – rejected with one set lookup /
+# regex before any detection work happens
+_SKIP_EXACT = frozenset({
+    'lol', 'lmao', 'kek', 'pog', 'pogu', 'pogchamp', 'w', 'l', 'gg', '+1', '-1', 'xd',
+})
+_URL_RE = re.compile(r'https?://\S+')
+
+# Matches messages that are only one or more [emote:id:name] tokens (with
+# optional whitespace). Compiled once so the hot path never recompiles it.
+_EMOTE_RE = re.compile(r'^(\s*\[emote:\d+:[^\]]+\]\s*)+$')
+
+# One-pass IRC line parser: [@tags ][:prefix ]command [params][ :trailing].
+# A single compiled match replaces the chain of partition() calls and their
+# intermediate substring copies; the regex engine scans the line once in C.
+_IRC_RE = re.compile(r'^(?:@(\S+) )?(?::(\S+) )?(\S+)(?: ([^:]\S*(?: [^:]\S*)*))?(?: :(.*))?$')
+
 # Add set of known bot usernames
 KNOWN_BOT_USERNAMES = {
     'streamelements', 'nightbot', 'moobot', 'wizebot', 'streamlabs', 'fossabot',
@@ -79,63 +193,185 @@ KNOWN_BOT_USERNAMES = {
 
 # ────────────────────────────────────────────────────────────────────────
 
+# HTTP/2 client for Azure – one connection reused across translations, with the
+# static auth headers built once instead of per request
+_client = httpx.Client(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=10, keepalive_expiry=300),
+    headers={
+        "User-Agent": "Mozilla/5.0",
+        "Content-Type": "application/json",
+        "Ocp-Apim-Subscription-Key": AZURE_TRANSLATOR_KEY or "",
+        "Ocp-Apim-Subscription-Region": AZURE_TRANSLATOR_REGION or "",
+    },
+)
+
+# Exact-match translation cache, (text, source_lang, target_lang) -> text.
+# A plain OrderedDict LRU (rather than functools.lru_cache) so the batch
+# worker can both consult and populate it for every item in a batch.
+_translation_cache = OrderedDict()
+_translation_cache_lock = threading.Lock()
+_TRANSLATION_CACHE_SIZE = 4096
+
+def _cache_get(key) -> Optional[str]:
+    with _translation_cache_lock:
+        translated = _translation_cache.get(key)
+        if translated is not None:
+            _translation_cache.move_to_end(key)
+        return translated
+
+def _cache_put(key, translated: str):
+    with _translation_cache_lock:
+        _translation_cache[key] = translated
+        _translation_cache.move_to_end(key)
+        while len(_translation_cache) > _TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+
+def _translate_batch(texts, source_lang: str):
+    """Translate a list of strings (same source language) in one Azure call.
+    Batching amortizes TLS/auth/framing overhead that otherwise dwarfs the tiny
+    chat payloads. Failures raise and are therefore never cached."""
+    url = AZURE_TRANSLATOR_ENDPOINT + "/translate"
+    params = {
+        "api-version": "3.0",
+        "from": source_lang,
+        "to": TARGET_LANGUAGE,
+    }
+    body = [{"text": t} for t in texts]
+    resp = _client.post(url, params=params, content=orjson.dumps(body))
+    resp.raise_for_status()
+    res = orjson.loads(resp.content)
+    return [html.unescape(item["translations"][0]["text"]) for item in res]
+
+class TokenBucket:
+    """Token-bucket rate limiter: allows bursts up to `capacity` sends and
+    refills at `refill_rate` tokens per second. Thread-safe."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, tokens: int = 1) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+            self.updated = now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
 class TwitchChatTranslator:
     def __init__(self, channel: str, oauth_token: Optional[str]):
         self.channel = channel.lower()
         self.oauth_token = oauth_token  # Without the leading "oauth:" – we add below
-        self.last_translation_time = 0
 
-        # HTTP session for Azure
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0",
-            "Content-Type": "application/json",
-        })
+        # Reconnect state: on_close signals the start() loop instead of
+        # recursing; backoff doubles per failed attempt, resets on connect
+        self._reconnect = threading.Event()
+        self._backoff = 5
+
+        # Static wire fragments, formatted once instead of per message
+        self._privmsg_prefix = f"PRIVMSG #{self.channel} :"
+        self._pong = "PONG :tmi.twitch.tv\r\n"
+        # Twitch allows ~20 messages per 30s for regular users; a token bucket
+        # lets bursty chat use that budget instead of dropping everything that
+        # lands within a fixed delay of the previous send. RATE_LIMIT_DELAY > 0
+        # keeps its old meaning of one send per that many seconds.
+        if RATE_LIMIT_DELAY > 0:
+            self.bucket = TokenBucket(1, 1.0 / RATE_LIMIT_DELAY)
+        else:
+            self.bucket = TokenBucket(20, 20 / 30.0)
+
+        # Worker pool so detection/translation never blocks the WebSocket
+        # reader thread (which must stay responsive to PINGs)
+        self._pool = ThreadPoolExecutor(max_workers=WORKER_THREADS)
+
+        # Pending (ws, username, text, source_lang) items awaiting a batched
+        # Azure call, flushed by a background worker thread
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        threading.Thread(target=self._translation_worker, daemon=True).start()
 
     # ─── Language Detection & Translation ────────────────────────────
 
     def detect_language(self, text: str) -> Optional[str]:
+        clean = _preprocess(text)
+        if clean is None:
+            return None
         try:
-            clean = text.strip()
-            if len(clean) < MIN_MESSAGE_LENGTH:
-                return None
-            alpha = sum(c.isalpha() for c in clean)
-            if alpha < 1:
-                return None
-            return detect(clean)
+            return _detect(clean)
         except Exception:
             return None
 
     def translate_text(self, text: str, source_lang: str) -> Optional[str]:
         if not AZURE_TRANSLATOR_KEY:
-            print("⚠️ No Azure Translator key for Twitch – cannot translate.")
+            log.warning("⚠️ No Azure Translator key for Twitch – cannot translate.")
             return None
-
-        path = "/translate"
-        url = AZURE_TRANSLATOR_ENDPOINT + path
-        params = {
-            "api-version": "3.0",
-            "from": source_lang,
-            "to": TARGET_LANGUAGE,
-        }
-        headers = {
-            "Ocp-Apim-Subscription-Key": AZURE_TRANSLATOR_KEY,
-            "Ocp-Apim-Subscription-Region": AZURE_TRANSLATOR_REGION,
-            "Content-type": "application/json",
-            "X-ClientTraceId": str(uuid.uuid4()),
-        }
-        body = [{"text": text}]
-
+        key = (text, source_lang, TARGET_LANGUAGE)
+        translated = _cache_get(key)
+        if translated is not None:
+            return translated
         try:
-            resp = self.session.post(url, params=params, headers=headers, json=body, timeout=10)
-            resp.raise_for_status()
-            res = resp.json()
-            if res and len(res) > 0:
-                translated = res[0]["translations"][0]["text"]
-                return html.unescape(translated)
+            translated = _translate_batch([text], source_lang)[0]
         except Exception as e:
-            print(f"⚠️ Azure error: {e}")
-        return None
+            log.warning(f"⚠️ Azure error: {e}")
+            return None
+        _cache_put(key, translated)
+        return translated
+
+    def _enqueue_translation(self, ws, username: str, text: str, source_lang: str):
+        translated = _cache_get((text, source_lang, TARGET_LANGUAGE))
+        if translated is not None:
+            self._dispatch_translation(ws, username, text, source_lang, translated)
+            return
+        with self._pending_lock:
+            self._pending.append((ws, username, text, source_lang))
+            pending = len(self._pending)
+        if pending >= _BATCH_MAX:
+            self._flush_event.set()
+
+    def _translation_worker(self):
+        while True:
+            self._flush_event.wait(_BATCH_WINDOW)
+            self._flush_event.clear()
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                continue
+            # One Azure call per source language – "from" is a request-level param
+            groups = {}
+            for item in batch:
+                groups.setdefault(item[3], []).append(item)
+            for source_lang, items in groups.items():
+                try:
+                    translations = _translate_batch([text for _, _, text, _ in items], source_lang)
+                except Exception as e:
+                    log.warning(f"⚠️ Azure error: {e}")
+                    continue
+                for (ws, username, text, _), translated in zip(items, translations):
+                    _cache_put((text, source_lang, TARGET_LANGUAGE), translated)
+                    try:
+                        self._dispatch_translation(ws, username, text, source_lang, translated)
+                    except Exception as e:
+                        # A stale ws (e.g. mid-reconnect) must only drop this
+                        # one message, never the worker thread itself
+                        log.warning(f"⚠️ Dispatch failed: {e}")
+
+    def _dispatch_translation(self, ws, username: str, original: str, detected: str, translated: str):
+        # Skip if translation is redundant
+        if is_redundant_translation(original, translated):
+            log.debug("   ⏭️ Skipped: Translation is redundant (same as original)")
+            return
+        # Format translation message as plain text (no /me)
+        translation = f"[by {username}] {translated} ({detected} > {TARGET_LANGUAGE})"
+        log.info(f"➡️  {translation}")
+        self.send_chat(ws, translation)
 
     # ─── IRC Helpers ─────────────────────────────────────────────────
 
@@ -144,24 +380,25 @@ class TwitchChatTranslator:
 
     def send_chat(self, ws: websocket.WebSocketApp, message: str):
         if not self.oauth_token:
-            print("⚠️ No OAuth – printing translation only: ", message)
+            log.info(f"⚠️ No OAuth – printing translation only: {message}")
             return
-        rate_ok = True
-        if RATE_LIMIT_DELAY > 0:
-            now = time.time()
-            if now - self.last_translation_time < RATE_LIMIT_DELAY:
-                rate_ok = False
-        if rate_ok:
-            self.send_raw(ws, f"PRIVMSG #{self.channel} :{message}")
-            self.last_translation_time = time.time()
-            print(f"✅ Sent: {message}")
+        if self.bucket.consume():
+            try:
+                ws.send(self._privmsg_prefix + message + "\r\n")
+            except Exception as e:
+                # Pool threads discard their Future, so an exception here would
+                # otherwise vanish silently; log it and drop the message
+                log.warning(f"⚠️ Send failed: {e}")
+                return
+            log.info(f"✅ Sent: {message}")
         else:
-            print("⏳ Rate limited – skipping send")
+            log.warning("⏳ Rate limited – skipping send")
 
     # ─── WebSocket Callbacks ─────────────────────────────────────────
 
     def on_open(self, ws):
-        print("🔗 IRC connection opened – authenticating…")
+        log.info("🔗 IRC connection opened – authenticating…")
+        self._backoff = 5  # successful connect resets the reconnect backoff
         if self.oauth_token:
             self.send_raw(ws, f"PASS oauth:{self.oauth_token}")
             self.send_raw(ws, f"NICK {TWITCH_BOT_USERNAME or 'justinfan12345'}")
@@ -171,7 +408,7 @@ class TwitchChatTranslator:
         # Request tags for easier parsing (optional)
         self.send_raw(ws, "CAP REQ :twitch.tv/tags")
         self.send_raw(ws, f"JOIN #{self.channel}")
-        print(f"✅ Joined #{self.channel}")
+        log.info(f"✅ Joined #{self.channel}")
 
     def handle_privmsg(self, ws, prefix: str, tags: str, msg: str):
         # Extract username from prefix
@@ -181,129 +418,126 @@ class TwitchChatTranslator:
 
         # Skip messages from known bots
         if username.lower() in KNOWN_BOT_USERNAMES:
-            print(f"   ⏭️ Skipped: Message from known bot '{username}'")
-            print()
+            log.debug(f"   ⏭️ Skipped: Message from known bot '{username}'")
+            return
+
+        log.info(f"👤 {username}: {msg}")
+
+        # Fast-reject common chat noise (interjections, bare links) with one
+        # set lookup / regex, ahead of _preprocess so short tokens like 'kek'
+        # are recognized here rather than falling through to the length gate
+        stripped = msg.strip()
+        if stripped.lower() in _SKIP_EXACT or _URL_RE.fullmatch(stripped):
+            log.debug("   ⏭️ Skipped: Known noise token or URL")
+            return
+
+        clean = _preprocess(stripped)
+        if clean is None:
+            log.debug(f"   ⏭️ Skipped: Too short (< {MIN_MESSAGE_LENGTH}) or no letters")
             return
 
-        print(f"👤 {username}: {msg}")
+        # Fast path: when translating to English, pure-ASCII text is
+        # overwhelmingly English already – ko/ru/zh need non-ASCII codepoints
+        # and Turkish in practice carries ğüşıöç. Skip without running the
+        # detector at all.
+        if TARGET_LANGUAGE == "en" and clean.isascii():
+            log.debug("   ⏭️ Skipped: ASCII-only message (assumed English)")
+            return
 
         # Skip messages that start with '!'
-        if msg.strip().startswith("!"):
-            print("   ⏭️ Skipped: Message starts with '!' (likely a command)")
-            print()
+        if clean.startswith("!"):
+            log.debug("   ⏭️ Skipped: Message starts with '!' (likely a command)")
             return
 
         # Skip messages that only contain one or more Kick emotes [emote:id:name] (with optional whitespace)
-        emote_pattern = r'^(\s*\[emote:\d+:[^\]]+\]\s*)+$'
-        if re.fullmatch(emote_pattern, msg.strip()):
-            print("   ⏭️ Skipped: Message contains only emote(s)")
-            print()
+        if _EMOTE_RE.fullmatch(clean):
+            log.debug("   ⏭️ Skipped: Message contains only emote(s)")
             return
 
         # Skip if message is only common English phrases
         if is_mostly_common_english(msg):
-            print("   ⏭️ Skipped: Message is only common English phrases")
-            print()
+            log.debug("   ⏭️ Skipped: Message is only common English phrases")
             return
 
-        clean = msg.strip()
-        if len(clean) < MIN_MESSAGE_LENGTH:
-            print(f"   ⏭️ Skipped: Too short (length {len(clean)} < {MIN_MESSAGE_LENGTH})")
-            print()
-            return
-        alpha = sum(c.isalpha() for c in clean)
-        if alpha < 1:
-            print(f"   ⏭️ Skipped: Not enough letters (alpha count {alpha})")
-            print()
-            return
         try:
-            detected = detect(clean)
+            detected = _detect(clean)
         except Exception:
-            print("   ⏭️ Skipped: Language detection failed")
-            print()
+            log.debug("   ⏭️ Skipped: Language detection failed")
             return
         # Allow base language match (e.g., zh, zh-cn, zh-tw)
-        if not any(detected == lang or detected.startswith(f"{lang}-") for lang in ALLOWED_LANGUAGES):
-            print(f"   ⏭️ Skipped: Language '{detected}' not in allowed list {ALLOWED_LANGUAGES}")
-            print()
-            return
-
-        translated = self.translate_text(msg, detected)
-        if not translated:
-            print("   ⏭️ Skipped: Translation failed or not available")
-            print()
+        if detected.split("-", 1)[0] not in ALLOWED_LANGUAGES:
+            log.debug(f"   ⏭️ Skipped: Language '{detected}' not in allowed list {set(ALLOWED_LANGUAGES)}")
             return
 
-        # Skip if translation is redundant
-        if is_redundant_translation(msg, translated):
-            print("   ⏭️ Skipped: Translation is redundant (same as original)")
-            print()
+        if not AZURE_TRANSLATOR_KEY:
+            log.warning("⚠️ No Azure Translator key for Twitch – cannot translate.")
             return
 
-        # Format translation message as plain text (no /me)
-        translation = f"[by {username}] {translated} ({detected} > {TARGET_LANGUAGE})"
-        print(f"➡️  {translation}")
-        self.send_chat(ws, translation)
-        print()  # Add a blank line for readability between messages
+        self._enqueue_translation(ws, username, clean, detected)
 
     def on_message(self, ws, raw):
-        # Twitch may send multiple IRC messages in one frame
-        for line in raw.split("\r\n"):
+        # Twitch may send multiple IRC messages in one frame. partition()
+        # returns 3-tuples instead of allocating a list per split, and walking
+        # the frame this way avoids building an intermediate list of lines.
+        while raw:
+            line, _, raw = raw.partition("\r\n")
             if not line:
                 continue
             if line.startswith("PING"):
-                self.send_raw(ws, "PONG :tmi.twitch.tv")
+                ws.send(self._pong)
+                continue
+            m = _IRC_RE.match(line)
+            if m is None:
                 continue
-            # Parse IRC message: [@tags ]:prefix command #channel :message
-            tags = ""
-            rest = line
-            if line.startswith("@"):  # tags present
-                tags, rest = line.split(" ", 1)
-            if rest.startswith(":"):
-                prefix, rest = rest[1:].split(" ", 1)
-            else:
-                prefix = ""
-            if " :" in rest:
-                command, msg = rest.split(" :", 1)
-            else:
-                command, msg = rest, ""
-            command_parts = command.split()
-            if len(command_parts) >= 1 and command_parts[0] == "PRIVMSG":
-                self.handle_privmsg(ws, prefix, tags, msg)
+            tags, prefix, command, params, trailing = m.groups()
+            if command == "PRIVMSG":
+                # Hand off to the pool – detection is CPU work and translation
+                # blocks on HTTP; keep the reader thread draining the socket
+                self._pool.submit(self.handle_privmsg, ws, prefix or "", tags or "", trailing or "")
 
     def on_error(self, ws, err):
-        print("⚠️ WebSocket error:", err)
+        log.warning(f"⚠️ WebSocket error: {err}")
 
     def on_close(self, ws, code, reason):
-        print(f"🔌 Connection closed: {code} {reason}")
+        log.warning(f"🔌 Connection closed: {code} {reason}")
         if code != 1000:
-            print("Reconnecting in 5 seconds…")
-            time.sleep(5)
-            self.start()
+            # Signal the start() loop instead of recursing into it – recursion
+            # deepened the stack on every reconnect
+            self._reconnect.set()
 
     # ─── Main Loop ───────────────────────────────────────────────────
 
     def start(self):
-        print(f"🤖 Twitch Chat Translator for #{self.channel}")
+        log.info(f"🤖 Twitch Chat Translator for #{self.channel}")
         if not AZURE_TRANSLATOR_KEY:
-            print("⚠️ Missing Azure credentials – will not translate.")
-        ws = websocket.WebSocketApp(
-            IRC_URL,
-            on_open=self.on_open,
-            on_message=self.on_message,
-            on_error=self.on_error,
-            on_close=self.on_close,
-        )
-        ws.run_forever()
+            log.warning("⚠️ Missing Azure credentials – will not translate.")
+        while True:
+            self._reconnect.clear()
+            ws = websocket.WebSocketApp(
+                IRC_URL,
+                on_open=self.on_open,
+                on_message=self.on_message,
+                on_error=self.on_error,
+                on_close=self.on_close,
+            )
+            # Library-level WebSocket pings keep the link alive without any
+            # Python-side frame handling
+            ws.run_forever(ping_interval=60, ping_timeout=10)
+            if not self._reconnect.is_set():
+                break  # clean close – we're done
+            log.warning(f"Reconnecting in {self._backoff} seconds…")
+            time.sleep(self._backoff)
+            self._backoff = min(300, self._backoff * 2)
 
 # ─── Entry Point ─────────────────────────────────────────────────────
 
 def main():
+    _setup_logging()
     channel = os.getenv("TWITCH_CHANNEL")
     if not channel and len(sys.argv) >= 2:
         channel = sys.argv[1]
     if not channel:
-        print("Usage: python twitch-chat-translator.py <channel> [oauth_token]")
+        log.error("Usage: python twitch-chat-translator.py <channel> [oauth_token]")
         sys.exit(1)
 
     oauth = None
@@ -313,9 +547,9 @@ def main():
         oauth = TWITCH_OAUTH_TOKEN
 
     if oauth:
-        print("🗝️  OAuth token provided – translations will be posted to chat.")
+        log.info("🗝️  OAuth token provided – translations will be posted to chat.")
     else:
-        print("👀 No OAuth token – read-only mode.")
+        log.info("👀 No OAuth token – read-only mode.")
 
     translator = TwitchChatTranslator(channel, oauth)
     translator.start()